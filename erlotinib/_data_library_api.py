@@ -5,11 +5,24 @@
 # full license details.
 #
 
+import functools
 import os
 
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=None)
+def _read_csv(path):
+    """
+    Returns the dataset in the CSV file at ``path`` as a
+    :class:`pandas.DataFrame`.
+
+    Files are only read and parsed once, subsequent calls return the cached
+    dataframe.
+    """
+    return pd.read_csv(path)
+
+
 class DataLibrary(object):
     r"""
     A collection of Erlotinib PKPD datasets.
@@ -44,7 +57,8 @@ class DataLibrary(object):
         times a week.
         """
         file_name = 'lxf_control_growth.csv'
-        data = pd.read_csv(self._path + file_name)
+        # Copy cached dataset, so modifications do not alter the cache
+        data = _read_csv(self._path + file_name).copy()
 
         return data
 
@@ -64,7 +78,8 @@ class DataLibrary(object):
         of 30 days and measured a couple times a week.
         """
         file_name = 'lxf_high_erlotinib_dose.csv'
-        data = pd.read_csv(self._path + file_name)
+        # Copy cached dataset, so modifications do not alter the cache
+        data = _read_csv(self._path + file_name).copy()
 
         return data
 
@@ -84,7 +99,8 @@ class DataLibrary(object):
         of 30 days and measured a couple times a week.
         """
         file_name = 'lxf_low_erlotinib_dose.csv'
-        data = pd.read_csv(self._path + file_name)
+        # Copy cached dataset, so modifications do not alter the cache
+        data = _read_csv(self._path + file_name).copy()
 
         return data
 
@@ -104,7 +120,8 @@ class DataLibrary(object):
         of 30 days and measured a couple times a week.
         """
         file_name = 'lxf_medium_erlotinib_dose.csv'
-        data = pd.read_csv(self._path + file_name)
+        # Copy cached dataset, so modifications do not alter the cache
+        data = _read_csv(self._path + file_name).copy()
 
         return data
 
@@ -123,6 +140,7 @@ class DataLibrary(object):
         mouse, either on day 0 or day 4.
         """
         file_name = 'lxf_single_erlotinib_dose.csv'
-        data = pd.read_csv(self._path + file_name)
+        # Copy cached dataset, so modifications do not alter the cache
+        data = _read_csv(self._path + file_name).copy()
 
         return data
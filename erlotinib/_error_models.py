@@ -247,8 +247,12 @@ class ConstantAndMultiplicativeGaussianErrorModel(ErrorModel):
         rel_samples = rng.normal(loc=0, scale=sigma_rel, size=sample_shape)
 
         # Construct final samples
+        # (Operations are performed in place to avoid temporary arrays)
         model_output = np.expand_dims(model_output, axis=1)
-        samples = model_output + base_samples + model_output * rel_samples
+        samples = base_samples
+        samples += model_output
+        rel_samples *= model_output
+        samples += rel_samples
 
         return samples
 
@@ -425,8 +429,11 @@ class MultiplicativeGaussianErrorModel(ErrorModel):
         rel_samples = rng.normal(loc=0, scale=sigma_rel, size=sample_shape)
 
         # Construct final samples
+        # (Operations are performed in place to avoid temporary arrays)
         model_output = np.expand_dims(model_output, axis=1)
-        samples = model_output + model_output * rel_samples
+        samples = rel_samples
+        samples *= model_output
+        samples += model_output
 
         return samples
 
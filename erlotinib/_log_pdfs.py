@@ -89,6 +89,18 @@ class HierarchicalLogLikelihood(pints.LogPDF):
         # Set parameter names and number of parameters
         self._set_number_and_parameter_names()
 
+        # Remember which population models contribute to the score, together
+        # with the positions of their parameters.
+        # (Heterogeneous models always score 0, and pooled models have no
+        # individual parameters in a hierarchical context, so their score is
+        # 0 as well)
+        self._scored_pop_models = [
+            (pop_model, indiv_params, pop_params)
+            for pop_model, indiv_params, pop_params in zip(
+                population_models, self._indiv_params, self._pop_params)
+            if not isinstance(
+                pop_model, (erlo.HeterogeneousModel, erlo.PooledModel))]
+
     def __call__(self, parameters):
         """
         Returns the log-likelihood score of the model.
@@ -97,23 +109,12 @@ class HierarchicalLogLikelihood(pints.LogPDF):
         parameters = np.asarray(parameters)
 
         # Compute population model scores
+        # (Parameter ranges are precomputed at instantiation)
         score = 0
-        start_index = 0
-        for pop_model in self._population_models:
-            # Get number of individual and population level parameters
-            n_indiv, n_pop = pop_model.n_hierarchical_parameters(self._n_ids)
-
-            # Get parameter ranges
-            end_indiv = start_index + n_indiv
-            end_pop = end_indiv + n_pop
-
-            # Add score
+        for pop_model, indiv_params, pop_params in self._scored_pop_models:
             score += pop_model.compute_log_likelihood(
-                parameters=parameters[end_indiv:end_pop],
-                observations=parameters[start_index:end_indiv])
-
-            # Shift start index
-            start_index = end_pop
+                parameters=parameters[pop_params[0]:pop_params[1]],
+                observations=parameters[indiv_params[0]:indiv_params[1]])
 
         # Return if values already lead to a rejection
         if score == -np.inf:
@@ -212,6 +213,7 @@ class HierarchicalLogLikelihood(pints.LogPDF):
         # Construct parameter names
         start = 0
         indiv_params = []
+        pop_params = []
         parameter_names = []
         for param_id, pop_model in enumerate(self._population_models):
             # Get number of hierarchical parameters
@@ -221,9 +223,10 @@ class HierarchicalLogLikelihood(pints.LogPDF):
             # Add a copy of the parameter name for each hierarchical parameter
             parameter_names += [indiv_names[param_id]] * n_parameters
 
-            # Remember positions of individual parameters
+            # Remember positions of individual and population parameters
             end = start + n_indiv
             indiv_params.append([start, end])
+            pop_params.append([end, start + n_parameters])
 
             # Shift start index
             start += n_parameters
@@ -233,8 +236,9 @@ class HierarchicalLogLikelihood(pints.LogPDF):
         self._n_parameters = len(parameter_names)
         self._n_indiv_params = len(indiv_names)
 
-        # Remember positions of individual parameters
+        # Remember positions of individual and population parameters
         self._indiv_params = indiv_params
+        self._pop_params = pop_params
 
     def get_id(self):
         """
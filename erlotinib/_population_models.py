@@ -6,6 +6,7 @@
 #
 
 import copy
+import math
 
 import numpy as np
 
@@ -126,7 +127,7 @@ class HeterogeneousModel(PopulationModel):
             An array-like object with the observations of the individuals. Each
             entry is assumed to belong to one individual.
         """
-        return 0
+        return 0.0
 
     def get_parameter_names(self):
         """
@@ -231,6 +232,111 @@ class LogNormalModel(PopulationModel):
         # Set default parameter names
         self._parameter_names = ['Mean', 'Std.']
 
+        # Create buffer for the log-transformed individual parameters
+        self._buffer = np.empty(shape=0)
+
+    def _compute_sufficient_statistics(self, observations):
+        """
+        Returns the number of observations, the sum and the mean of the log
+        psis, and the sum of squared deviations of the log psis from their
+        mean.
+
+        These statistics determine the log-likelihood score for any
+        population parameters. If any psi is non-positive or non-finite,
+        ``None`` is returned.
+        """
+        # Compute log psis in a buffer that is reused across calls
+        # (avoids allocating intermediate arrays for each evaluation)
+        n_ids = len(observations)
+        if len(self._buffer) != n_ids:
+            self._buffer = np.empty(shape=n_ids)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_psis = np.log(observations, out=self._buffer)
+        sum_log_psis = np.sum(log_psis)
+
+        if not math.isfinite(sum_log_psis):
+            # Non-positive or non-finite psis produce infinities or NaNs
+            # (Checking the sum avoids separate validity passes over the
+            # observations)
+            return None
+
+        mean_log_psis = sum_log_psis / n_ids if n_ids > 0 else 0
+
+        # Compute sum of squared deviations
+        # (The sum is computed as a dot product, which avoids allocating the
+        # squared deviations as an intermediate array)
+        deviations = np.subtract(log_psis, mean_log_psis, out=self._buffer)
+        sum_squared_deviations = np.dot(deviations, deviations)
+
+        return n_ids, sum_log_psis, mean_log_psis, sum_squared_deviations
+
+    def compute_batch_log_likelihood(self, parameters, observations):
+        r"""
+        Returns the unnormalised log-likelihood scores of the population model
+        for a batch of parameters and observations.
+
+        This is equivalent to calling :meth:`compute_log_likelihood` for each
+        row of ``parameters`` and ``observations``, but evaluates all scores in
+        one vectorised pass. This may be useful for samplers that evaluate
+        many positions at once, such as ensemble samplers.
+
+        The returned value is a NumPy array with shape ``(n_batch,)``.
+
+        Parameters
+        ----------
+        parameters
+            An array-like object of shape ``(n_batch, 2)`` with the model
+            parameter values for :math:`\mu` and :math:`\sigma`.
+        observations
+            An array-like object of shape ``(n_batch, n_ids)`` with the
+            parameter values for the individuals,
+            :math:`\psi ^{\text{obs}}_1, \ldots , \psi ^{\text{obs}}_N`.
+        """
+        parameters = np.asarray(parameters, dtype=np.float64)
+        observations = np.asarray(observations, dtype=np.float64)
+
+        if (parameters.ndim != 2) or (
+                parameters.shape[1] != self._n_parameters):
+            raise ValueError(
+                'The parameters have to be of shape (n_batch, 2).')
+
+        if (observations.ndim != 2) or (
+                len(observations) != len(parameters)):
+            raise ValueError(
+                'The observations have to be of shape (n_batch, n_ids).')
+
+        # Create container for scores
+        # (Entries that are not evaluated below are rejected)
+        n_batch, n_ids = observations.shape
+        scores = np.full(shape=n_batch, fill_value=-np.inf)
+
+        # Only evaluate entries with strictly positive mean and std and
+        # strictly positive, finite psis
+        means, stds = parameters[:, 0], parameters[:, 1]
+        mask = (means > 0) & (stds > 0) & np.all(
+            (observations > 0) & np.isfinite(observations), axis=1)
+        mean_log, var_log = self.transform_parameters(
+            means[mask], stds[mask])
+
+        # Only evaluate entries where the variance of log psi does not
+        # numerically underflow
+        indices = np.flatnonzero(mask)[var_log > 0]
+        mean_log = mean_log[var_log > 0]
+        var_log = var_log[var_log > 0]
+
+        # Compute log-likelihood scores
+        log_psis = np.log(observations[indices])
+        deviations = log_psis - mean_log[:, np.newaxis]
+        batch_scores = -n_ids * np.log(var_log) / 2 \
+            - np.sum(log_psis, axis=1) \
+            - np.einsum('ij,ij->i', deviations, deviations) / (2 * var_log)
+
+        # If scores evaluate to NaN, return -infinity
+        batch_scores[np.isnan(batch_scores)] = -np.inf
+        scores[indices] = batch_scores
+
+        return scores
+
     def compute_log_likelihood(self, parameters, observations):
         r"""
         Returns the unnormalised log-likelihood score of the population model.
@@ -261,20 +367,43 @@ class LogNormalModel(PopulationModel):
             An array like object with the parameter values for the individuals,
             :math:`\psi ^{\text{obs}}_1, \ldots , \psi ^{\text{obs}}_N`.
         """
-        log_psis = np.log(observations)
+        # Convert observations to a float array once, so subsequent
+        # operations do not need to convert them again
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if mean <= 0 or std <= 0:
-            # The mean and var of log psi are strictly positive
+            # The mean and std of psi are strictly positive
             return -np.inf
 
+        # Get sufficient statistics of the log psis
+        statistics = self._compute_sufficient_statistics(observations)
+
+        if statistics is None:
+            # The log-normal distribution has only support on the positive
+            # real line. Returning early avoids propagating the infinities
+            # and NaNs of non-positive or non-finite psis through the score.
+            return -np.inf
+
+        n_ids, sum_log_psis, mean_log_psis, sum_squared_deviations = \
+            statistics
+
         # Transform parameters to mean_log and var_log
         mean_log, var_log = self.transform_parameters(mean, std)
 
+        if var_log <= 0:
+            # The variance of log psi may numerically underflow for very
+            # small std
+            return -np.inf
+
         # Compute log-likelihood score
-        n_ids = len(log_psis)
-        score = -n_ids * np.log(var_log) / 2 - np.sum(log_psis) \
-            - np.sum((log_psis - mean_log) ** 2) / (2 * var_log)
+        # (Scalars are handled by math, which is faster than NumPy's ufuncs
+        # for scalar inputs)
+        sum_squares = \
+            sum_squared_deviations + n_ids * (mean_log_psis - mean_log) ** 2
+        inv_twice_var_log = 0.5 / var_log
+        score = -n_ids * math.log(var_log) / 2 - sum_log_psis \
+            - sum_squares * inv_twice_var_log
 
         # If score evaluates to NaN, return -infinity
         if np.isnan(score):
@@ -444,6 +573,10 @@ class PooledModel(PopulationModel):
         # Set default parameter names
         self._parameter_names = ['Pooled']
 
+        # Set defaults for the cached samples
+        self._last_sample_key = None
+        self._last_samples = None
+
     def compute_log_likelihood(self, parameters, observations):
         r"""
         Returns the unnormalised log-likelihood score of the population model.
@@ -469,7 +602,7 @@ class PooledModel(PopulationModel):
 
         # Return 0, if observations is empty
         if len(observations) == 0:
-            return 0
+            return 0.0
 
         # Return - infinity, if any observation deviates from the parameter
         for observation in observations:
@@ -477,7 +610,7 @@ class PooledModel(PopulationModel):
                 return -np.inf
 
         # If all individual parameters equal the population parameter, return 0
-        return 0
+        return 0.0
 
     def get_parameter_names(self):
         """
@@ -536,9 +669,21 @@ class PooledModel(PopulationModel):
         if n_samples is None:
             return samples
 
+        # If the same samples were returned by the previous call, return the
+        # cached samples
+        key = (samples.item(0), samples.dtype, n_samples)
+        if key == self._last_sample_key:
+            return self._last_samples
+
         # If more samples are wanted, broadcast input parameter to shape
         # (n_samples,)
-        samples = np.broadcast_to(samples, shape=(n_samples,))
+        # (A fresh scalar is broadcast, so the read-only view does not alias
+        # the input array and can be safely reused by subsequent calls)
+        value = np.array(samples.item(0), dtype=samples.dtype)
+        samples = np.broadcast_to(value, shape=(n_samples,))
+        self._last_sample_key = key
+        self._last_samples = samples
+
         return samples
 
     def set_parameter_names(self, names=None):
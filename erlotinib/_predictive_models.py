@@ -345,8 +345,10 @@ class PosteriorPredictiveModel(DataDrivenPredictiveModel):
         sample_key, param_key, iter_key, run_key = keys
 
         # Get number of samples and number of parameters
-        n_iters = len(posterior[iter_key].unique())
-        n_runs = len(posterior[run_key].unique())
+        # (Unique runs are only computed once and reused below)
+        runs = pd.unique(posterior[run_key].to_numpy())
+        n_iters = len(pd.unique(posterior[iter_key].to_numpy()))
+        n_runs = len(runs)
         n_samples = n_runs * n_iters
         n_parameters = self._predictive_model.n_parameters()
 
@@ -354,7 +356,7 @@ class PosteriorPredictiveModel(DataDrivenPredictiveModel):
         container = np.empty(shape=(n_samples, n_parameters))
 
         # Fill container with samples
-        for run_id, run in enumerate(posterior[run_key].unique()):
+        for run_id, run in enumerate(runs):
             # Mask samples for run
             mask = posterior[run_key] == run
             temp_df = posterior[mask][[sample_key, param_key, iter_key]]
@@ -480,15 +482,18 @@ class PosteriorPredictiveModel(DataDrivenPredictiveModel):
         n_samples = int(n_samples)
 
         # Sort times
-        times = np.sort(times)
-
-        # Create container for samples
-        container = pd.DataFrame(
-            columns=['ID', 'Biomarker', 'Time', 'Sample'])
+        # (Times are cast to floats, so the time column of the samples has the
+        # same dtype with and without the dosing regimen)
+        times = np.sort(np.asarray(times, dtype=np.float64))
 
         # Get model outputs (biomarkers)
         outputs = self._predictive_model.get_output_names()
 
+        # Create container for samples
+        n_outputs = len(outputs)
+        n_times = len(times)
+        container = np.empty(shape=(n_samples, n_outputs, n_times))
+
         # Instantiate random number generator for sampling from the posterior
         rng = np.random.default_rng(seed=seed)
 
@@ -505,23 +510,24 @@ class PosteriorPredictiveModel(DataDrivenPredictiveModel):
             # Sample from predictive model
             sample = self._predictive_model.sample(
                 parameters, times, n_samples, seed, return_df=False)
+            container[sample_id - 1] = sample[..., 0]
 
-            # Append samples to dataframe
-            for output_id, name in enumerate(outputs):
-                container = container.append(pd.DataFrame({
-                    'ID': sample_id,
-                    'Biomarker': name,
-                    'Time': times,
-                    'Sample': sample[output_id, :, 0]}))
+        # Structure samples in a pandas.DataFrame
+        # (Samples are ordered by ID, biomarker and time)
+        samples = pd.DataFrame({
+            'ID': np.repeat(sample_ids, n_outputs * n_times),
+            'Biomarker': np.tile(np.repeat(outputs, n_times), n_samples),
+            'Time': np.tile(times, n_samples * n_outputs),
+            'Sample': container.flatten()})
 
         # Add dosing regimen, if set
         final_time = np.max(times)
         regimen = self.get_dosing_regimen(final_time)
         if (regimen is not None) and (include_regimen is True):
             # Append dosing regimen only once for all samples
-            container = container.append(regimen)
+            samples = pd.concat([samples, regimen], ignore_index=True)
 
-        return container
+        return samples
 
 
 class PredictiveModel(object):
@@ -740,8 +746,10 @@ class PredictiveModel(object):
         if final_time is None:
             final_time = np.inf
 
-        # Sort regimen into dataframe
-        regimen_df = pd.DataFrame(columns=['Time', 'Duration', 'Dose'])
+        # Sort regimen into dataframes
+        # (The dataframes are concatenated only once all dose events are
+        # processed)
+        dose_events = []
         for dose_event in regimen.events():
             # Get dose amount
             dose_rate = dose_event.level()
@@ -760,7 +768,7 @@ class PredictiveModel(object):
 
             if period == 0:
                 # Dose is administered only once
-                regimen_df = regimen_df.append(pd.DataFrame({
+                dose_events.append(pd.DataFrame({
                     'Time': [start_time],
                     'Duration': [dose_duration],
                     'Dose': [dose_amount]}))
@@ -785,13 +793,17 @@ class PredictiveModel(object):
             mask = dose_times <= final_time
             dose_times = dose_times[mask]
 
-            # Add dose administrations to dataframe
-            regimen_df = regimen_df.append(pd.DataFrame({
+            # Add dose administrations to dataframes
+            dose_events.append(pd.DataFrame({
                 'Time': dose_times,
                 'Duration': dose_duration,
                 'Dose': dose_amount}))
 
         # If no dose event before final_time exist, return None
+        if not dose_events:
+            return None
+
+        regimen_df = pd.concat(dose_events)
         if regimen_df.empty:
             return None
 
@@ -890,7 +902,9 @@ class PredictiveModel(object):
                 'The length of parameters does not match n_parameters.')
 
         # Sort times
-        times = np.sort(times)
+        # (Times are cast to floats, so the time column of the samples has the
+        # same dtype with and without the dosing regimen)
+        times = np.sort(np.asarray(times, dtype=np.float64))
 
         # Sort parameters into mechanistic model params and error params
         n_parameters = self._mechanistic_model.n_parameters()
@@ -926,28 +940,24 @@ class PredictiveModel(object):
             return container
 
         # Structure samples in a pandas.DataFrame
+        # (Samples are ordered by biomarker, time and ID)
         output_names = self._mechanistic_model.outputs()
         sample_ids = np.arange(start=1, stop=n_samples+1)
-        samples = pd.DataFrame(
-            columns=['ID', 'Biomarker', 'Time', 'Sample'])
-
-        # Fill in all samples at a specific time point at once
-        for output_id, name in enumerate(output_names):
-            for time_id, time in enumerate(times):
-                samples = samples.append(pd.DataFrame({
-                    'ID': sample_ids,
-                    'Time': time,
-                    'Biomarker': name,
-                    'Sample': container[output_id, time_id, :]}))
+        samples = pd.DataFrame({
+            'ID': np.tile(sample_ids, n_outputs * n_times),
+            'Biomarker': np.repeat(output_names, n_times * n_samples),
+            'Time': np.tile(np.repeat(times, n_samples), n_outputs),
+            'Sample': container.flatten()})
 
         # Add dosing regimen information, if set
         final_time = np.max(times)
         regimen = self.get_dosing_regimen(final_time)
         if (regimen is not None) and (include_regimen is True):
             # Add dosing regimen for each sample
-            for _id in sample_ids:
-                regimen['ID'] = _id
-                samples = samples.append(regimen)
+            # (All regimen rows are concatenated to the samples at once)
+            regimens = pd.concat([regimen] * n_samples)
+            regimens['ID'] = np.repeat(sample_ids, len(regimen))
+            samples = pd.concat([samples, regimens], ignore_index=True)
 
         return samples
 
@@ -1313,7 +1323,9 @@ class PredictivePopulationModel(PredictiveModel):
         n_samples = int(n_samples)
 
         # Sort times
-        times = np.sort(times)
+        # (Times are cast to floats, so the time column of the samples has the
+        # same dtype with and without the dosing regimen)
+        times = np.sort(np.asarray(times, dtype=np.float64))
 
         # Create container for "virtual patients"
         n_parameters = self._predictive_model.n_parameters()
@@ -1362,28 +1374,24 @@ class PredictivePopulationModel(PredictiveModel):
             return container
 
         # Structure samples in a pandas.DataFrame
+        # (Samples are ordered by biomarker, time and ID)
         output_names = self._predictive_model.get_output_names()
         sample_ids = np.arange(start=1, stop=n_samples+1)
-        samples = pd.DataFrame(
-            columns=['ID', 'Biomarker', 'Time', 'Sample'])
-
-        # Fill in all samples at a specific time point at once
-        for output_id, name in enumerate(output_names):
-            for time_id, time in enumerate(times):
-                samples = samples.append(pd.DataFrame({
-                    'ID': sample_ids,
-                    'Time': time,
-                    'Biomarker': name,
-                    'Sample': container[output_id, time_id, :]}))
+        samples = pd.DataFrame({
+            'ID': np.tile(sample_ids, n_outputs * n_times),
+            'Biomarker': np.repeat(output_names, n_times * n_samples),
+            'Time': np.tile(np.repeat(times, n_samples), n_outputs),
+            'Sample': container.flatten()})
 
         # Add dosing regimen information, if set
         final_time = np.max(times)
         regimen = self.get_dosing_regimen(final_time)
         if (regimen is not None) and (include_regimen is True):
             # Add dosing regimen for each sample
-            for _id in sample_ids:
-                regimen['ID'] = _id
-                samples = samples.append(regimen)
+            # (All regimen rows are concatenated to the samples at once)
+            regimens = pd.concat([regimen] * n_samples)
+            regimens['ID'] = np.repeat(sample_ids, len(regimen))
+            samples = pd.concat([samples, regimens], ignore_index=True)
 
         return samples
 
@@ -1469,6 +1477,66 @@ class PriorPredictiveModel(DataDrivenPredictiveModel):
                 'number of parameters of the predictive model.')
 
         self._log_prior = log_prior
+        self._uniform_bounds = self._get_uniform_bounds(log_prior)
+
+    def _get_uniform_bounds(self, log_prior):
+        """
+        Returns the lower and upper bounds of the log-prior, if it is a
+        (composition of) uniform prior(s) with rectangular boundaries.
+        Otherwise ``None`` is returned.
+
+        (pints does not expose the components of a
+        :class:`pints.ComposedLogPrior` or the boundaries of a
+        :class:`pints.UniformLogPrior`, so they are looked up defensively.)
+        """
+        priors = [log_prior]
+        if isinstance(log_prior, pints.ComposedLogPrior):
+            priors = getattr(log_prior, '_priors', None)
+            if priors is None:
+                return None
+
+        lower = []
+        upper = []
+        for prior in priors:
+            boundaries = getattr(prior, '_boundaries', None)
+            if not isinstance(prior, pints.UniformLogPrior) or \
+                    not isinstance(boundaries, pints.RectangularBoundaries):
+                return None
+
+            lower.append(boundaries.lower())
+            upper.append(boundaries.upper())
+
+        return np.concatenate(lower), np.concatenate(upper)
+
+    def _sample_prior(self, n_samples):
+        """
+        Returns parameters that are drawn from the log-prior in form of a
+        :class:`numpy.ndarray` of shape ``(n_samples, n_parameters)``.
+
+        For a given seed the parameters are drawn in the same order as
+        drawing one sample at a time with :meth:`pints.LogPrior.sample`, such
+        that the first samples do not depend on ``n_samples``.
+
+        (If the log-prior is composed of uniform priors, all parameters are
+        drawn with one call to :func:`numpy.random.uniform`. This relies on
+        the private ``_priors`` and ``_boundaries`` attributes of pints, and
+        on :meth:`pints.RectangularBoundaries.sample` drawing with
+        ``np.random.uniform(lower, upper, size=(n, d))``.)
+        """
+        n_parameters = self._log_prior.n_parameters()
+        if self._uniform_bounds is not None:
+            # Draw all parameters at once
+            # (numpy fills the array row by row, so the draws are identical
+            # to drawing one sample at a time.)
+            lower, upper = self._uniform_bounds
+            return np.random.uniform(
+                lower, upper, size=(n_samples, n_parameters))
+
+        parameters = np.empty(shape=(n_samples, n_parameters))
+        for sample_id in range(n_samples):
+            parameters[sample_id] = self._log_prior.sample().flatten()
+
+        return parameters
 
     def sample(self, times, n_samples=None, seed=None, include_regimen=False):
         """
@@ -1510,21 +1578,26 @@ class PriorPredictiveModel(DataDrivenPredictiveModel):
             base_seed = seed
 
         # Sort times
-        times = np.sort(times)
-
-        # Create container for samples
-        container = pd.DataFrame(
-            columns=['ID', 'Biomarker', 'Time', 'Sample'])
+        # (Times are cast to floats, so the time column of the samples has the
+        # same dtype with and without the dosing regimen)
+        times = np.sort(np.asarray(times, dtype=np.float64))
 
         # Get model outputs (biomarkers)
         outputs = self._predictive_model.get_output_names()
 
+        # Create container for samples
+        n_outputs = len(outputs)
+        n_times = len(times)
+        container = np.empty(shape=(n_samples, n_outputs, n_times))
+
+        # Draw all parameters from the log-prior at once
+        # (The predictive model is seeded separately, so this does not change
+        # the draws.)
+        prior_samples = self._sample_prior(n_samples)
+
         # Draw samples
         sample_ids = np.arange(start=1, stop=n_samples+1)
-        for sample_id in sample_ids:
-            # Sample parameter
-            parameters = self._log_prior.sample().flatten()
-
+        for sample_id, parameters in zip(sample_ids, prior_samples):
             if seed is not None:
                 # Set seed for predictive model to base_seed + sample_id
                 # (Needs to change every iteration)
@@ -1533,20 +1606,21 @@ class PriorPredictiveModel(DataDrivenPredictiveModel):
             # Sample from predictive model
             sample = self._predictive_model.sample(
                 parameters, times, n_samples, seed, return_df=False)
+            container[sample_id - 1] = sample[..., 0]
 
-            # Append samples to dataframe
-            for output_id, name in enumerate(outputs):
-                container = container.append(pd.DataFrame({
-                    'ID': sample_id,
-                    'Biomarker': name,
-                    'Time': times,
-                    'Sample': sample[output_id, :, 0]}))
+        # Structure samples in a pandas.DataFrame
+        # (Samples are ordered by ID, biomarker and time)
+        samples = pd.DataFrame({
+            'ID': np.repeat(sample_ids, n_outputs * n_times),
+            'Biomarker': np.tile(np.repeat(outputs, n_times), n_samples),
+            'Time': np.tile(times, n_samples * n_outputs),
+            'Sample': container.flatten()})
 
         # Add dosing regimen, if set
         final_time = np.max(times)
         regimen = self.get_dosing_regimen(final_time)
         if (regimen is not None) and (include_regimen is True):
             # Append dosing regimen only once for all samples
-            container = container.append(regimen)
+            samples = pd.concat([samples, regimen], ignore_index=True)
 
-        return container
+        return samples
@@ -46,6 +46,14 @@ class TestDataLibrary(unittest.TestCase):
 
         self.assertIsInstance(data, pd.DataFrame)
 
+    def test_returned_data_is_copy(self):
+        # Modifying a returned dataset does not affect later calls
+        data = self.data_library.lung_cancer_control_group()
+        data['ID'] = -1
+
+        data = self.data_library.lung_cancer_control_group()
+        self.assertNotIn(-1, data['ID'].unique())
+
 
 class TestLungCancerControlGroup(unittest.TestCase):
     """
@@ -79,6 +79,54 @@ class TestLogNormalModel(unittest.TestCase):
     def setUpClass(cls):
         cls.pop_model = erlo.LogNormalModel()
 
+    def test_compute_batch_log_likelihood(self):
+        # Test case I: batch scores agree with individual scores
+        n_batch = 5
+        n_ids = 10
+        rng = np.random.default_rng(seed=1)
+        parameters = rng.uniform(low=0.5, high=2, size=(n_batch, 2))
+        observations = rng.lognormal(size=(n_batch, n_ids))
+
+        scores = self.pop_model.compute_batch_log_likelihood(
+            parameters, observations)
+
+        self.assertEqual(scores.shape, (n_batch,))
+        for batch_id in range(n_batch):
+            ref_score = self.pop_model.compute_log_likelihood(
+                parameters[batch_id], observations[batch_id])
+            self.assertAlmostEqual(scores[batch_id], ref_score)
+
+        # Test case II: invalid entries are rejected
+        parameters[0, 0] = -1
+        parameters[1, 1] = 0
+        observations[2, 3] = 0
+        observations[3, 4] = np.inf
+        scores = self.pop_model.compute_batch_log_likelihood(
+            parameters, observations)
+
+        self.assertEqual(scores[0], -np.inf)
+        self.assertEqual(scores[1], -np.inf)
+        self.assertEqual(scores[2], -np.inf)
+        self.assertEqual(scores[3], -np.inf)
+        ref_score = self.pop_model.compute_log_likelihood(
+            parameters[4], observations[4])
+        self.assertAlmostEqual(scores[4], ref_score)
+
+    def test_compute_batch_log_likelihood_bad_input(self):
+        # Parameters have wrong shape
+        parameters = [1, 1]
+        observations = [[1, 1]]
+        with self.assertRaisesRegex(ValueError, 'The parameters have to'):
+            self.pop_model.compute_batch_log_likelihood(
+                parameters, observations)
+
+        # Observations have wrong shape
+        parameters = [[1, 1], [1, 1]]
+        observations = [[1, 1]]
+        with self.assertRaisesRegex(ValueError, 'The observations have to'):
+            self.pop_model.compute_batch_log_likelihood(
+                parameters, observations)
+
     def test_compute_log_likelihood(self):
         # Hard to test exactly, but at least test some edge cases where
         # loglikelihood is straightforward to compute analytically
@@ -254,6 +302,46 @@ class TestLogNormalModel(unittest.TestCase):
         score = self.pop_model.compute_log_likelihood(parameters, psis)
         self.assertEqual(score, -np.inf)
 
+        # Test case V: psis negative or zero
+
+        # Test case V.1
+        psis = [np.exp(10)] * (n_ids - 1) + [0]
+        mu = 1
+        sigma = 1
+
+        parameters = [mu] + [sigma]
+        score = self.pop_model.compute_log_likelihood(parameters, psis)
+        self.assertEqual(score, -np.inf)
+
+        # Test case V.2
+        psis = [np.exp(10)] * (n_ids - 1) + [-1]
+        mu = 1
+        sigma = 1
+
+        parameters = [mu] + [sigma]
+        score = self.pop_model.compute_log_likelihood(parameters, psis)
+        self.assertEqual(score, -np.inf)
+
+        # Test case VI: psis not finite
+
+        # Test case VI.1
+        psis = [np.exp(10)] * (n_ids - 1) + [np.inf]
+        mu = 1
+        sigma = 1
+
+        parameters = [mu] + [sigma]
+        score = self.pop_model.compute_log_likelihood(parameters, psis)
+        self.assertEqual(score, -np.inf)
+
+        # Test case VI.2
+        psis = [np.exp(10)] * (n_ids - 1) + [np.nan]
+        mu = 1
+        sigma = 1
+
+        parameters = [mu] + [sigma]
+        score = self.pop_model.compute_log_likelihood(parameters, psis)
+        self.assertEqual(score, -np.inf)
+
     def test_get_parameter_names(self):
         names = ['Mean', 'Std.']
 
@@ -429,6 +517,31 @@ class TestPooledModel(unittest.TestCase):
         self.assertEqual(sample[2], parameters[0])
         self.assertEqual(sample[3], parameters[0])
 
+        # Test repeated sampling with a different parameter
+        parameters = [5]
+        n_samples = 4
+        sample = self.pop_model.sample(parameters, n_samples=n_samples)
+
+        self.assertEqual(
+            sample.shape, (n_samples,))
+        self.assertEqual(sample[0], parameters[0])
+        self.assertEqual(sample[1], parameters[0])
+        self.assertEqual(sample[2], parameters[0])
+        self.assertEqual(sample[3], parameters[0])
+
+        # Test that modifying the input in place does not change the samples
+        # of a later call with the previous value
+        parameters = np.array([1.0])
+        n_samples = 3
+        self.pop_model.sample(parameters, n_samples=n_samples)
+        parameters[0] = 5.0
+        sample = self.pop_model.sample(np.array([1.0]), n_samples=n_samples)
+
+        self.assertEqual(sample.shape, (n_samples,))
+        self.assertEqual(sample[0], 1.0)
+        self.assertEqual(sample[1], 1.0)
+        self.assertEqual(sample[2], 1.0)
+
     def test_sample_bad_input(self):
         # Too many paramaters
         parameters = [1, 1, 1, 1, 1]
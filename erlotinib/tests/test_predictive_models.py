@@ -5,6 +5,8 @@
 # full license details.
 #
 
+import copy
+import functools
 import unittest
 
 import numpy as np
@@ -14,6 +16,116 @@ import pints
 import erlotinib as erlo
 
 
+# Measurement times of the sample tests
+TIMES = np.arange(1, 6)
+
+# Error models shared by the predictive models of the tests
+# (Predictive models copy their error models, so sharing is safe.)
+_ERROR_MODELS = (erlo.ConstantAndMultiplicativeGaussianErrorModel(),)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pd_model():
+    """
+    Returns the tumour growth inhibition model.
+
+    (The model is shared across test classes, since its construction
+    compiles a simulation. Predictive models deep copy the mechanistic
+    model, so sharing is safe.)
+    """
+    path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
+    return erlo.PharmacodynamicModel(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pk_model(direct):
+    """
+    Returns the one compartment PK model with dosing in the central
+    compartment, either directly or via a dose compartment.
+
+    (One model is shared per route of administration, so tests that mutate
+    it have to work on a copy. ``direct`` is always passed as a keyword, so
+    each route has a single cache entry.)
+    """
+    path = erlo.ModelLibrary().one_compartment_pk_model()
+    mechanistic_model = erlo.PharmacokineticModel(path)
+    mechanistic_model.set_administration('central', direct=direct)
+    return mechanistic_model
+
+
+def _unique_values(samples, column):
+    """
+    Returns the unique values of a dataframe column in order of appearance,
+    ignoring missing values.
+    """
+    values = samples[column].to_numpy()
+    return pd.unique(values[pd.notna(values)])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_uniform_prior(bounds):
+    """
+    Returns a composed log-prior of uniform priors with the provided
+    ``((lower, upper), ...)`` bounds.
+    """
+    return pints.ComposedLogPrior(*[
+        pints.UniformLogPrior(lower, upper) for lower, upper in bounds])
+
+
+# Expected dosing regimens of the dosing regimen tests
+SINGLE_BOLUS_REGIMEN = pd.DataFrame({
+    'Time': [1.0], 'Duration': [0.01], 'Dose': [1.0]})
+SINGLE_INFUSION_REGIMEN = pd.DataFrame({
+    'Time': [1.0], 'Duration': [1.0], 'Dose': [1.0]})
+TWO_BOLUS_REGIMEN = pd.DataFrame({
+    'Time': [1.0, 2.0], 'Duration': [0.01] * 2, 'Dose': [1.0] * 2})
+THREE_BOLUS_REGIMEN = pd.DataFrame({
+    'Time': [1.0, 2.0, 3.0], 'Duration': [0.01] * 3, 'Dose': [1.0] * 3})
+
+# Expected samples of the predictive models (seed 42, TIMES)
+# (Samples are compared to an absolute tolerance of 1e-7, in line with the
+# precision of unittest's assertAlmostEqual.)
+EXPECTED_PD_SAMPLES_N1 = np.array([
+    0.970159924388273, -0.3837168004345003, 1.3172158091846213,
+    1.4896478457110898, -1.4664469447762758])
+EXPECTED_PD_SAMPLES_N4 = np.array([
+    1.0556423390683263, -0.3270113841421633, 1.609052478543911,
+    1.6938106489072702, -1.3308066638991631, -0.6770137193349925,
+    0.8103166170457382, 0.3554210376910704, 0.5926284393333348,
+    -0.24255566520628413, 1.5900163762325767, 1.3392789962107843,
+    0.5878641834748815, 1.6324903256719818, 1.0513958594002857,
+    -0.24719096826112444, 0.8924949457952482, -0.47361160445867245,
+    1.364551743048893, 0.5143221311427919])
+EXPECTED_PK_SAMPLES_N1 = np.array([
+    0.19357442536989605, -0.8873567434686567, 0.7844710370969462,
+    0.9585509622439399, -1.9500467417155718])
+EXPECTED_PK_REGIMEN_SAMPLES_N1 = np.array([
+    0.19357442536989605, -0.47051946530234423, 1.1301703133958951,
+    1.1414603643105294, -1.9399955984363169])
+EXPECTED_PK_REGIMEN_SAMPLES_N2 = np.array([
+    0.9959660719183876, -0.3861061623036009, 1.2887071287477976,
+    2.0146427922545884, -1.1360658058662318, -1.2240387200366378,
+    0.4075153414639344, -0.3078411315299712, 0.12431122545485368,
+    -0.7816727453841099])
+EXPECTED_PRIOR_PD_SAMPLES_N1 = np.array([
+    2.8622881485041396, 3.7272644272099664, -2.5604320890107455,
+    -5.445074975020219, -8.562594546870663])
+EXPECTED_PRIOR_PD_SAMPLES_N4 = np.array([
+    3.6599791844429284, -12.696938587267084, -3.82460662961628,
+    -4.103207219325659, -5.196420346964001, 10.726522931974097,
+    1.4866633054676286, 5.48736409468915, -4.211329523375031,
+    -2.38819374047191, -3.6298125294796812, 9.209895487514647,
+    -6.256268368313989, -5.03014957524413, 6.367870976692225,
+    -1.2252254747096893, -0.7853509638638059, 12.177527343575,
+    -6.435165240274607, 10.471501140030037])
+EXPECTED_PRIOR_PK_SAMPLES_N1 = np.array([
+    0.9418268811969496, 2.4414001899620565, -2.1070223214978583,
+    -3.2700124414629426, -7.167939155896637])
+EXPECTED_PRIOR_PK_REGIMEN_SAMPLES_N1 = np.array([
+    0.9418268811969484, 2.535202697375215, -1.9337139346520897,
+    -3.481678813431062, -6.595926429217902])
+
+
 class TestDataDrivenPredictiveModel(unittest.TestCase):
     """
     Tests the erlo.DataDrivenPredictiveModel class.
@@ -24,8 +136,7 @@ class TestDataDrivenPredictiveModel(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Get mechanistic model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        mechanistic_model = erlo.PharmacodynamicModel(path)
+        mechanistic_model = _get_pd_model()
 
         # Define error models
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
@@ -90,8 +201,7 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
     def setUpClass(cls):
         # Test model I: Individual predictive model
         # Create predictive model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        mechanistic_model = erlo.PharmacodynamicModel(path)
+        mechanistic_model = _get_pd_model()
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
         cls.pred_model = erlo.PredictiveModel(
             mechanistic_model, error_models)
@@ -249,18 +359,15 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
 
     def test_sample(self):
         # Test case I: Just one sample
-        times = [1, 2, 3, 4, 5]
+        times = TIMES
         seed = 42
         samples = self.model.sample(times, seed=seed)
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -270,13 +377,8 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -293,12 +395,9 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 4)
@@ -311,13 +410,8 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 20)
@@ -334,12 +428,9 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -349,13 +440,8 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -366,9 +452,7 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertAlmostEqual(values[4], -83.65720486709867)
 
         # Test case III.2: PK model, regimen not set
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        mechanistic_model = erlo.PharmacokineticModel(path)
-        mechanistic_model.set_administration('central', direct=False)
+        mechanistic_model = _get_pk_model(direct=False)
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
         predictive_model = erlo.PredictiveModel(
             mechanistic_model, error_models)
@@ -388,12 +472,9 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -403,13 +484,8 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -427,33 +503,23 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample', 'Duration', 'Dose'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 2)
         self.assertEqual(sample_ids[0], 1)
         self.assertTrue(np.isnan(sample_ids[1]))
 
-        biomarkers = samples['Biomarker'].dropna().unique()
+        biomarkers = _unique_values(samples, 'Biomarker')
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = _unique_values(samples, 'Time')
+        np.testing.assert_array_equal(sample_times, TIMES)
 
-        values = samples['Sample'].dropna().unique()
+        values = _unique_values(samples, 'Sample')
         self.assertEqual(len(values), 5)
         self.assertAlmostEqual(values[0], 10.257639409972427)
         self.assertAlmostEqual(values[1], 28.48397119211002)
@@ -461,11 +527,11 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         self.assertAlmostEqual(values[3], -38.17331623508392)
         self.assertAlmostEqual(values[4], -83.64232025329919)
 
-        doses = samples['Dose'].dropna().unique()
+        doses = _unique_values(samples, 'Dose')
         self.assertEqual(len(doses), 1)
         self.assertAlmostEqual(doses[0], 1)
 
-        durations = samples['Duration'].dropna().unique()
+        durations = _unique_values(samples, 'Duration')
         self.assertEqual(len(durations), 1)
         self.assertAlmostEqual(durations[0], 2)
 
@@ -478,41 +544,41 @@ class TestPredictiveModel(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Get mechanistic model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        cls.mechanistic_model = erlo.PharmacodynamicModel(path)
+        cls.mechanistic_model = _get_pd_model()
 
         # Define error models
-        cls.error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
+        cls.error_models = _ERROR_MODELS
 
         # Create predictive model
         cls.model = erlo.PredictiveModel(
             cls.mechanistic_model, cls.error_models)
 
-    def test_bad_instantiation(self):
-        # Mechanistic model has wrong type
-        mechanistic_model = 'wrong type'
-
-        with self.assertRaisesRegex(TypeError, 'The mechanistic model'):
-            erlo.PredictiveModel(mechanistic_model, self.error_models)
-
-        # Error model has wrong type
-        error_models = ['wrong type']
-
-        with self.assertRaisesRegex(TypeError, 'All error models'):
-            erlo.PredictiveModel(self.mechanistic_model, error_models)
-
-        # Non-existent outputs
-        outputs = ['Not', 'existent']
-
-        with self.assertRaisesRegex(KeyError, 'The variable <Not> does not'):
-            erlo.PredictiveModel(
-                self.mechanistic_model, self.error_models, outputs)
+        # Create predictive model with a PK model
+        # (Tests that set a dosing regimen need to work on a copy.)
+        cls.pk_model = erlo.PredictiveModel(
+            _get_pk_model(direct=True), cls.error_models)
 
-        # Wrong number of error models
-        error_models = [erlo.ErrorModel(), erlo.ErrorModel()]
-
-        with self.assertRaisesRegex(ValueError, 'Wrong number of error'):
-            erlo.PredictiveModel(self.mechanistic_model, error_models)
+    def test_bad_instantiation(self):
+        mechanistic_model = self.mechanistic_model
+        error_models = self.error_models
+        cases = [
+            # Mechanistic model has wrong type
+            ('wrong type', error_models, None,
+                TypeError, 'The mechanistic model'),
+            # Error model has wrong type
+            (mechanistic_model, ['wrong type'], None,
+                TypeError, 'All error models'),
+            # Non-existent outputs
+            (mechanistic_model, error_models, ['Not', 'existent'],
+                KeyError, 'The variable <Not> does not'),
+            # Wrong number of error models
+            (mechanistic_model, [erlo.ErrorModel(), erlo.ErrorModel()],
+                None, ValueError, 'Wrong number of error')]
+
+        for mech_model, err_models, outputs, error, message in cases:
+            with self.subTest(message):
+                with self.assertRaisesRegex(error, message):
+                    erlo.PredictiveModel(mech_model, err_models, outputs)
 
     def test_fix_parameters(self):
         # Test case I: fix some parameters
@@ -593,9 +659,7 @@ class TestPredictiveModel(unittest.TestCase):
         self.assertEqual(names[6], 'Sigma rel.')
 
         # Test case II: Multi-output problem
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        model = erlo.PharmacokineticModel(path)
-        model.set_administration('central', direct=False)
+        model = copy.deepcopy(_get_pk_model(direct=False))
         model.set_outputs(['central.drug_amount', 'dose.drug_amount'])
         error_models = [
             erlo.ConstantAndMultiplicativeGaussianErrorModel(),
@@ -624,11 +688,7 @@ class TestPredictiveModel(unittest.TestCase):
         self.assertIsNone(self.model.get_dosing_regimen())
 
         # Test case II: Mechanistic model supports dosing regimens
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        mechanistic_model = erlo.PharmacokineticModel(path)
-        mechanistic_model.set_administration('central')
-        model = erlo.PredictiveModel(
-            mechanistic_model, self.error_models)
+        model = copy.deepcopy(self.pk_model)
 
         # Test case II.1: Dosing regimen not set
         self.assertIsNone(model.get_dosing_regimen())
@@ -638,97 +698,35 @@ class TestPredictiveModel(unittest.TestCase):
         regimen_df = model.get_dosing_regimen()
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 1)
-        self.assertEqual(times[0], 1)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 0.01)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), SINGLE_BOLUS_REGIMEN,
+            check_exact=True)
 
         # Test case II.3 Set single infusion
         model.set_dosing_regimen(dose=1, start=1, duration=1)
         regimen_df = model.get_dosing_regimen()
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 1)
-        self.assertEqual(times[0], 1)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 1)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), SINGLE_INFUSION_REGIMEN,
+            check_exact=True)
 
         # Test case II.4 Multiple doses
         model.set_dosing_regimen(dose=1, start=1, period=1, num=3)
         regimen_df = model.get_dosing_regimen()
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 3)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 0.01)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), THREE_BOLUS_REGIMEN,
+            check_exact=True)
 
         # Set final time
         regimen_df = model.get_dosing_regimen(final_time=1.5)
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 1)
-        self.assertEqual(times[0], 1)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 0.01)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), SINGLE_BOLUS_REGIMEN,
+            check_exact=True)
 
         # Set final time, such that regimen dataframe would be empty
         regimen_df = model.get_dosing_regimen(final_time=0)
@@ -740,51 +738,17 @@ class TestPredictiveModel(unittest.TestCase):
         regimen_df = model.get_dosing_regimen()
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 1)
-        self.assertEqual(times[0], 1)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 0.01)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), SINGLE_BOLUS_REGIMEN,
+            check_exact=True)
 
         # Set final time
-        regimen_df = model.get_dosing_regimen(final_time=5)
+        regimen_df = model.get_dosing_regimen(final_time=2)
 
         self.assertIsInstance(regimen_df, pd.DataFrame)
-
-        keys = regimen_df.keys()
-        self.assertEqual(len(keys), 3)
-        self.assertEqual(keys[0], 'Time')
-        self.assertEqual(keys[1], 'Duration')
-        self.assertEqual(keys[2], 'Dose')
-
-        times = regimen_df['Time'].to_numpy()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
-
-        durations = regimen_df['Duration'].unique()
-        self.assertEqual(len(durations), 1)
-        self.assertEqual(durations[0], 0.01)
-
-        doses = regimen_df['Dose'].unique()
-        self.assertEqual(len(doses), 1)
-        self.assertEqual(doses[0], 1)
+        pd.testing.assert_frame_equal(
+            regimen_df.reset_index(drop=True), TWO_BOLUS_REGIMEN,
+            check_exact=True)
 
     def test_get_submodels(self):
         # Test case I: no fixed parameters
@@ -828,338 +792,122 @@ class TestPredictiveModel(unittest.TestCase):
     def test_n_parameters(self):
         self.assertEqual(self.model.n_parameters(), 7)
 
-    def test_sample(self):
-        # Test case I: Just one sample
-        parameters = [1, 1, 1, 1, 1, 1, 0.1]
-        times = [1, 2, 3, 4, 5]
-        seed = 42
-
-        # Test case I.1: Return as pd.DataFrame
-        samples = self.model.sample(parameters, times, seed=seed)
+    def _check_samples(
+            self, samples, n_ids, biomarker, times, expected_samples,
+            dose=None, duration=None):
+        """
+        Checks the format and the values of a samples dataframe.
 
+        If a dose is provided, the dataframe is expected to include the
+        dosing regimen.
+        """
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        keys = ['ID', 'Biomarker', 'Time', 'Sample']
+        if dose is not None:
+            keys += ['Duration', 'Dose']
+        self.assertEqual(list(samples.columns), keys)
+
+        # Compare measurements to reference dataframe
+        # (Dose events have no sample and are checked separately below.)
+        n_times = len(times)
+        reference = pd.DataFrame({
+            'ID': np.tile(np.arange(1, n_ids + 1), n_times),
+            'Biomarker': biomarker,
+            'Time': np.repeat(times, n_ids).astype(np.float64),
+            'Sample': expected_samples})
+        measurements = samples.loc[
+            samples['Sample'].notna(), ['ID', 'Biomarker', 'Time', 'Sample']]
+        pd.testing.assert_frame_equal(
+            measurements.reset_index(drop=True), reference,
+            check_exact=False, rtol=0, atol=1e-7)
+
+        if dose is None:
+            return None
 
         sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 1)
-        self.assertEqual(sample_ids[0], 1)
-
-        biomarkers = samples['Biomarker'].unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
-
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        np.testing.assert_array_equal(sample_ids, np.arange(1, n_ids + 1))
 
-        values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.970159924388273)
-        self.assertAlmostEqual(values[1], -0.3837168004345003)
-        self.assertAlmostEqual(values[2], 1.3172158091846213)
-        self.assertAlmostEqual(values[3], 1.4896478457110898)
-        self.assertAlmostEqual(values[4], -1.4664469447762758)
+        doses = _unique_values(samples, 'Dose')
+        self.assertEqual(len(doses), 1)
+        self.assertAlmostEqual(doses[0], dose)
 
-        # Test case I.2: Return as numpy.ndarray
-        samples = self.model.sample(
-            parameters, times, seed=seed, return_df=False)
+        durations = _unique_values(samples, 'Duration')
+        self.assertEqual(len(durations), 1)
+        self.assertAlmostEqual(durations[0], duration)
 
-        n_outputs = 1
-        n_times = 5
-        n_samples = 1
-        self.assertEqual(samples.shape, (n_outputs, n_times, n_samples))
-        self.assertAlmostEqual(samples[0, 0, 0], 0.970159924388273)
-        self.assertAlmostEqual(samples[0, 1, 0], -0.3837168004345003)
-        self.assertAlmostEqual(samples[0, 2, 0], 1.3172158091846213)
-        self.assertAlmostEqual(samples[0, 3, 0], 1.4896478457110898)
-        self.assertAlmostEqual(samples[0, 4, 0], -1.4664469447762758)
+    def test_sample_single(self):
+        parameters = [1, 1, 1, 1, 1, 1, 0.1]
+        times = TIMES
+        seed = 42
 
-        # Test case II: More than one sample
+        # Sample as pd.DataFrame
+        # (The dosing regimen is not returned for a PDModel, even if the
+        # flag is True. The numpy.ndarray return is covered by
+        # test_sample_multi.)
+        for include_regimen in [False, True]:
+            with self.subTest(include_regimen=include_regimen):
+                samples = self.model.sample(
+                    parameters, times, seed=seed,
+                    include_regimen=include_regimen)
+                self._check_samples(
+                    samples, 1, 'myokit.tumour_volume', times,
+                    EXPECTED_PD_SAMPLES_N1)
+
+    def test_sample_multi(self):
+        parameters = [1, 1, 1, 1, 1, 1, 0.1]
+        times = TIMES
+        seed = 42
         n_samples = 4
 
-        # Test case .1: Return as pd.DataFrame
-        samples = self.model.sample(
-            parameters, times, n_samples=n_samples, seed=seed)
-
-        self.assertIsInstance(samples, pd.DataFrame)
-
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-
-        sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 4)
-        self.assertEqual(sample_ids[0], 1)
-        self.assertEqual(sample_ids[1], 2)
-        self.assertEqual(sample_ids[2], 3)
-        self.assertEqual(sample_ids[3], 4)
-
-        biomarkers = samples['Biomarker'].unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
-
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
-
-        values = samples['Sample'].unique()
-        self.assertEqual(len(values), 20)
-        self.assertAlmostEqual(values[0], 1.0556423390683263)
-        self.assertAlmostEqual(values[1], -0.3270113841421633)
-        self.assertAlmostEqual(values[2], 1.609052478543911)
-        self.assertAlmostEqual(values[3], 1.6938106489072702)
-        self.assertAlmostEqual(values[4], -1.3308066638991631)
-        self.assertAlmostEqual(values[5], -0.6770137193349925)
-        self.assertAlmostEqual(values[6], 0.8103166170457382)
-        self.assertAlmostEqual(values[7], 0.3554210376910704)
-        self.assertAlmostEqual(values[8], 0.5926284393333348)
-        self.assertAlmostEqual(values[9], -0.24255566520628413)
-        self.assertAlmostEqual(values[10], 1.5900163762325767)
-        self.assertAlmostEqual(values[11], 1.3392789962107843)
-        self.assertAlmostEqual(values[12], 0.5878641834748815)
-        self.assertAlmostEqual(values[13], 1.6324903256719818)
-        self.assertAlmostEqual(values[14], 1.0513958594002857)
-        self.assertAlmostEqual(values[15], -0.24719096826112444)
-        self.assertAlmostEqual(values[16], 0.8924949457952482)
-        self.assertAlmostEqual(values[17], -0.47361160445867245)
-        self.assertAlmostEqual(values[18], 1.364551743048893)
-        self.assertAlmostEqual(values[19], 0.5143221311427919)
-
-        # Test case II.2: Return as numpy.ndarray
+        # Sample
+        # (Returned as numpy.ndarray, so the time and sample axes can be
+        # told apart. The dataframe layout for multiple IDs is covered by
+        # test_sample_pk_with_regimen.)
         samples = self.model.sample(
             parameters, times, n_samples=n_samples, seed=seed, return_df=False)
 
         n_outputs = 1
         n_times = 5
         self.assertEqual(samples.shape, (n_outputs, n_times, n_samples))
-        self.assertAlmostEqual(samples[0, 0, 0], 1.0556423390683263)
-        self.assertAlmostEqual(samples[0, 0, 1], -0.3270113841421633)
-        self.assertAlmostEqual(samples[0, 0, 2], 1.609052478543911)
-        self.assertAlmostEqual(samples[0, 0, 3], 1.6938106489072702)
-        self.assertAlmostEqual(samples[0, 1, 0], -1.3308066638991631)
-        self.assertAlmostEqual(samples[0, 1, 1], -0.6770137193349925)
-        self.assertAlmostEqual(samples[0, 1, 2], 0.8103166170457382)
-        self.assertAlmostEqual(samples[0, 1, 3], 0.3554210376910704)
-        self.assertAlmostEqual(samples[0, 2, 0], 0.5926284393333348)
-        self.assertAlmostEqual(samples[0, 2, 1], -0.24255566520628413)
-        self.assertAlmostEqual(samples[0, 2, 2], 1.5900163762325767)
-        self.assertAlmostEqual(samples[0, 2, 3], 1.3392789962107843)
-        self.assertAlmostEqual(samples[0, 3, 0], 0.5878641834748815)
-        self.assertAlmostEqual(samples[0, 3, 1], 1.6324903256719818)
-        self.assertAlmostEqual(samples[0, 3, 2], 1.0513958594002857)
-        self.assertAlmostEqual(samples[0, 3, 3], -0.24719096826112444)
-        self.assertAlmostEqual(samples[0, 4, 0], 0.8924949457952482)
-        self.assertAlmostEqual(samples[0, 4, 1], -0.47361160445867245)
-        self.assertAlmostEqual(samples[0, 4, 2], 1.364551743048893)
-        self.assertAlmostEqual(samples[0, 4, 3], 0.5143221311427919)
-
-        # Test case III: Return dosing regimen
-
-        # Test case III.1: PDModel, dosing regimen is not returned even
-        # if flag is True
-        samples = self.model.sample(
-            parameters, times, seed=seed, include_regimen=True)
-
-        self.assertIsInstance(samples, pd.DataFrame)
-
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-
-        sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 1)
-        self.assertEqual(sample_ids[0], 1)
-
-        biomarkers = samples['Biomarker'].unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
-
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
-
-        values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.970159924388273)
-        self.assertAlmostEqual(values[1], -0.3837168004345003)
-        self.assertAlmostEqual(values[2], 1.3172158091846213)
-        self.assertAlmostEqual(values[3], 1.4896478457110898)
-        self.assertAlmostEqual(values[4], -1.4664469447762758)
-
-        # Test case III.2: PKmodel, where the dosing regimen is not set
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        mechanistic_model = erlo.PharmacokineticModel(path)
-        mechanistic_model.set_administration('central')
-        model = erlo.PredictiveModel(
-            mechanistic_model, self.error_models)
+        np.testing.assert_allclose(
+            samples[0].flatten(), EXPECTED_PD_SAMPLES_N4, rtol=0, atol=1e-7)
 
-        # Sample
+    def test_sample_pk_no_regimen(self):
         parameters = [1, 1, 1, 1, 1]
-        samples = model.sample(
-            parameters, times, seed=seed, include_regimen=True)
-
-        self.assertIsInstance(samples, pd.DataFrame)
-
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-
-        sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 1)
-        self.assertEqual(sample_ids[0], 1)
-
-        biomarkers = samples['Biomarker'].unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'central.drug_concentration')
-
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
-
-        values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.19357442536989605)
-        self.assertAlmostEqual(values[1], -0.8873567434686567)
-        self.assertAlmostEqual(values[2], 0.7844710370969462)
-        self.assertAlmostEqual(values[3], 0.9585509622439399)
-        self.assertAlmostEqual(values[4], -1.9500467417155718)
-
-        # Test case III.3: PKmodel, dosing regimen is set
-        model.set_dosing_regimen(1, 1, period=1, num=2)
+        times = TIMES
+        seed = 42
 
-        # Sample
-        parameters = [1, 1, 1, 1, 1]
-        samples = model.sample(
+        # Sample (dosing regimen is not set)
+        samples = self.pk_model.sample(
             parameters, times, seed=seed, include_regimen=True)
+        self._check_samples(
+            samples, 1, 'central.drug_concentration', times,
+            EXPECTED_PK_SAMPLES_N1)
 
-        self.assertIsInstance(samples, pd.DataFrame)
-
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
-
-        sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 1)
-        self.assertEqual(sample_ids[0], 1)
-
-        biomarkers = samples['Biomarker'].dropna().unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'central.drug_concentration')
-
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
-
-        values = samples['Sample'].dropna().unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.19357442536989605)
-        self.assertAlmostEqual(values[1], -0.47051946530234423)
-        self.assertAlmostEqual(values[2], 1.1301703133958951)
-        self.assertAlmostEqual(values[3], 1.1414603643105294)
-        self.assertAlmostEqual(values[4], -1.9399955984363169)
-
-        doses = samples['Dose'].dropna().unique()
-        self.assertEqual(len(doses), 1)
-        self.assertAlmostEqual(doses[0], 1)
-
-        durations = samples['Duration'].dropna().unique()
-        self.assertEqual(len(durations), 1)
-        self.assertAlmostEqual(durations[0], 0.01)
-
-        # Test case III.4: PKmodel, dosing regimen is set, 2 samples
-        # Sample
+    def test_sample_pk_with_regimen(self):
         parameters = [1, 1, 1, 1, 1]
-        samples = model.sample(
-            parameters, times, n_samples=2, seed=seed, include_regimen=True)
-
-        self.assertIsInstance(samples, pd.DataFrame)
-
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
-
-        sample_ids = samples['ID'].unique()
-        self.assertEqual(len(sample_ids), 2)
-        self.assertEqual(sample_ids[0], 1)
-        self.assertEqual(sample_ids[1], 2)
-
-        biomarkers = samples['Biomarker'].dropna().unique()
-        self.assertEqual(len(biomarkers), 1)
-        self.assertEqual(biomarkers[0], 'central.drug_concentration')
-
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        times = TIMES
+        seed = 42
 
-        values = samples['Sample'].dropna().unique()
-        self.assertEqual(len(values), 10)
-        self.assertAlmostEqual(values[0], 0.9959660719183876)
-        self.assertAlmostEqual(values[1], -0.3861061623036009)
-        self.assertAlmostEqual(values[2], 1.2887071287477976)
-        self.assertAlmostEqual(values[3], 2.0146427922545884)
-        self.assertAlmostEqual(values[4], -1.1360658058662318)
-        self.assertAlmostEqual(values[5], -1.2240387200366378)
-        self.assertAlmostEqual(values[6], 0.4075153414639344)
-        self.assertAlmostEqual(values[7], -0.3078411315299712)
-        self.assertAlmostEqual(values[8], 0.12431122545485368)
-        self.assertAlmostEqual(values[9], -0.7816727453841099)
-
-        doses = samples['Dose'].dropna().unique()
-        self.assertEqual(len(doses), 1)
-        self.assertAlmostEqual(doses[0], 1)
+        # Set dosing regimen
+        # (Work on a copy, so the shared PK model stays regimen free.)
+        model = copy.deepcopy(self.pk_model)
+        model.set_dosing_regimen(1, 1, period=1, num=2)
 
-        durations = samples['Duration'].dropna().unique()
-        self.assertEqual(len(durations), 1)
-        self.assertAlmostEqual(durations[0], 0.01)
+        # Test case I: One sample
+        # Test case II: Two samples
+        cases = [
+            (None, 1, EXPECTED_PK_REGIMEN_SAMPLES_N1),
+            (2, 2, EXPECTED_PK_REGIMEN_SAMPLES_N2)]
+        for n_samples, n_ids, expected_samples in cases:
+            with self.subTest(n_samples=n_samples):
+                samples = model.sample(
+                    parameters, times, n_samples=n_samples, seed=seed,
+                    include_regimen=True)
+                self._check_samples(
+                    samples, n_ids, 'central.drug_concentration', times,
+                    expected_samples, dose=1, duration=0.01)
 
     def test_sample_bad_input(self):
         # Parameters are not of length n_parameters
@@ -1178,8 +926,7 @@ class TestPredictivePopulationModel(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Get mechanistic and error model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        mechanistic_model = erlo.PharmacodynamicModel(path)
+        mechanistic_model = _get_pd_model()
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
 
         # Create predictive model
@@ -1203,8 +950,7 @@ class TestPredictivePopulationModel(unittest.TestCase):
     def test_instantiation(self):
         # Define order of population model with params
         # Get mechanistic and error model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        mechanistic_model = erlo.PharmacodynamicModel(path)
+        mechanistic_model = _get_pd_model()
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
 
         # Create predictive model
@@ -1371,9 +1117,7 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertEqual(names[7], 'Pooled Sigma rel.')
 
         # Test case II: Multi-output problem
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        model = erlo.PharmacokineticModel(path)
-        model.set_administration('central', direct=False)
+        model = copy.deepcopy(_get_pk_model(direct=False))
         model.set_outputs(['central.drug_amount', 'dose.drug_amount'])
         error_models = [
             erlo.ConstantAndMultiplicativeGaussianErrorModel(),
@@ -1473,7 +1217,7 @@ class TestPredictivePopulationModel(unittest.TestCase):
     def test_sample(self):
         # Test case I: Just one sample
         parameters = [1, 1, 1, 1, 1, 1, 0.1, 0.1]
-        times = [1, 2, 3, 4, 5]
+        times = TIMES
         seed = 42
 
         # Test case I.1: Return as pd.DataFrame
@@ -1481,12 +1225,9 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1496,13 +1237,8 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -1535,12 +1271,9 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 4)
@@ -1553,13 +1286,8 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 20)
@@ -1590,12 +1318,9 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1605,13 +1330,8 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -1622,9 +1342,7 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertAlmostEqual(values[4], 0.7137169898523077)
 
         # Test case III.2: PKmodel, where the dosing regimen is not set
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        mechanistic_model = erlo.PharmacokineticModel(path)
-        mechanistic_model.set_administration('central', direct=False)
+        mechanistic_model = _get_pk_model(direct=False)
         error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
         predictive_model = erlo.PredictiveModel(
             mechanistic_model, error_models)
@@ -1638,12 +1356,9 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1653,13 +1368,8 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
         self.assertEqual(len(values), 5)
@@ -1678,32 +1388,22 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample', 'Duration', 'Dose'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
         self.assertEqual(sample_ids[0], 1)
 
-        biomarkers = samples['Biomarker'].dropna().unique()
+        biomarkers = _unique_values(samples, 'Biomarker')
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = _unique_values(samples, 'Time')
+        np.testing.assert_array_equal(sample_times, TIMES)
 
-        values = samples['Sample'].dropna().unique()
+        values = _unique_values(samples, 'Sample')
         self.assertEqual(len(values), 5)
         self.assertAlmostEqual(values[0], 0.6010875382040474)
         self.assertAlmostEqual(values[1], 0.9494472511510463)
@@ -1711,11 +1411,11 @@ class TestPredictivePopulationModel(unittest.TestCase):
         self.assertAlmostEqual(values[3], 0.6678547210989847)
         self.assertAlmostEqual(values[4], 0.30760362908683914)
 
-        doses = samples['Dose'].dropna().unique()
+        doses = _unique_values(samples, 'Dose')
         self.assertEqual(len(doses), 1)
         self.assertAlmostEqual(doses[0], 1)
 
-        durations = samples['Duration'].dropna().unique()
+        durations = _unique_values(samples, 'Duration')
         self.assertEqual(len(durations), 1)
         self.assertAlmostEqual(durations[0], 0.01)
 
@@ -1726,44 +1426,34 @@ class TestPredictivePopulationModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample', 'Duration', 'Dose'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 2)
         self.assertEqual(sample_ids[0], 1)
         self.assertEqual(sample_ids[1], 2)
 
-        biomarkers = samples['Biomarker'].dropna().unique()
+        biomarkers = _unique_values(samples, 'Biomarker')
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = _unique_values(samples, 'Time')
+        np.testing.assert_array_equal(sample_times, TIMES)
 
-        values = samples['Sample'].dropna().unique()
+        values = _unique_values(samples, 'Sample')
         self.assertEqual(len(values), 10)
         self.assertAlmostEqual(values[0], 0.6010875382040474)
         self.assertAlmostEqual(values[1], 0.3979077263135499)
         self.assertAlmostEqual(values[8], 0.30760362908683914)
         self.assertAlmostEqual(values[9], 0.28454670539055454)
 
-        doses = samples['Dose'].dropna().unique()
+        doses = _unique_values(samples, 'Dose')
         self.assertEqual(len(doses), 1)
         self.assertAlmostEqual(doses[0], 1)
 
-        durations = samples['Duration'].dropna().unique()
+        durations = _unique_values(samples, 'Duration')
         self.assertEqual(len(durations), 1)
         self.assertAlmostEqual(durations[0], 0.01)
 
@@ -1783,64 +1473,45 @@ class TestPriorPredictiveModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Get mechanistic model
-        path = erlo.ModelLibrary().tumour_growth_inhibition_model_koch()
-        mechanistic_model = erlo.PharmacodynamicModel(path)
-
-        # Define error models
-        error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
-
-        # Create predictive model
+        # Get predictive model
         cls.predictive_model = erlo.PredictiveModel(
-            mechanistic_model, error_models)
+            _get_pd_model(), _ERROR_MODELS)
 
         # Create prior
-        cls.log_prior = pints.ComposedLogPrior(
-            pints.UniformLogPrior(0, 1),
-            pints.UniformLogPrior(1, 2),
-            pints.UniformLogPrior(2, 3),
-            pints.UniformLogPrior(3, 4),
-            pints.UniformLogPrior(4, 5),
-            pints.UniformLogPrior(5, 6),
-            pints.UniformLogPrior(6, 7))
+        cls.log_prior = _get_uniform_prior(
+            ((0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7)))
 
         # Create prior predictive model
         cls.model = erlo.PriorPredictiveModel(
             cls.predictive_model, cls.log_prior)
 
     def test_bad_instantiation(self):
-        # Predictive model has wrong type
-        predictive_model = 'wrong type'
-
-        with self.assertRaisesRegex(ValueError, 'The provided predictive'):
-            erlo.PriorPredictiveModel(predictive_model, self.log_prior)
-
-        # Prior has woring type
-        log_prior = 'wrong type'
-
-        with self.assertRaisesRegex(ValueError, 'The provided log-prior'):
-            erlo.PriorPredictiveModel(self.predictive_model, log_prior)
-
-        # Dimension of predictive model and log-prior don't match
-        log_prior = pints.UniformLogPrior(0, 1)  # dim 1, but 7 params
-
-        with self.assertRaisesRegex(ValueError, 'The dimension of the'):
-            erlo.PriorPredictiveModel(self.predictive_model, log_prior)
+        cases = [
+            # Predictive model has wrong type
+            ('wrong type', self.log_prior, 'The provided predictive'),
+            # Prior has wrong type
+            (self.predictive_model, 'wrong type', 'The provided log-prior'),
+            # Dimension of predictive model and log-prior don't match
+            # (dim 1, but 7 params)
+            (self.predictive_model, pints.UniformLogPrior(0, 1),
+                'The dimension of the')]
+
+        for predictive_model, log_prior, message in cases:
+            with self.subTest(message):
+                with self.assertRaisesRegex(ValueError, message):
+                    erlo.PriorPredictiveModel(predictive_model, log_prior)
 
     def test_sample(self):
         # Test case I: Just one sample
-        times = [1, 2, 3, 4, 5]
+        times = TIMES
         seed = 42
         samples = self.model.sample(times, seed=seed)
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1850,21 +1521,12 @@ class TestPriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 2.8622881485041396)
-        self.assertAlmostEqual(values[1], 3.7272644272099664)
-        self.assertAlmostEqual(values[2], -2.5604320890107455)
-        self.assertAlmostEqual(values[3], -5.445074975020219)
-        self.assertAlmostEqual(values[4], -8.562594546870663)
+        np.testing.assert_allclose(
+            values, EXPECTED_PRIOR_PD_SAMPLES_N1, rtol=0, atol=1e-7)
 
         # Test case II: More than one sample
         n_samples = 4
@@ -1873,12 +1535,9 @@ class TestPriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 4)
@@ -1891,36 +1550,12 @@ class TestPriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
-        self.assertEqual(len(values), 20)
-        self.assertAlmostEqual(values[0], 3.6599791844429284)
-        self.assertAlmostEqual(values[1], -12.696938587267084)
-        self.assertAlmostEqual(values[2], -3.82460662961628)
-        self.assertAlmostEqual(values[3], -4.103207219325659)
-        self.assertAlmostEqual(values[4], -5.196420346964001)
-        self.assertAlmostEqual(values[5], 10.726522931974097)
-        self.assertAlmostEqual(values[6], 1.4866633054676286)
-        self.assertAlmostEqual(values[7], 5.48736409468915)
-        self.assertAlmostEqual(values[8], -4.211329523375031)
-        self.assertAlmostEqual(values[9], -2.38819374047191)
-        self.assertAlmostEqual(values[10], -3.6298125294796812)
-        self.assertAlmostEqual(values[11], 9.209895487514647)
-        self.assertAlmostEqual(values[12], -6.256268368313989)
-        self.assertAlmostEqual(values[13], -5.03014957524413)
-        self.assertAlmostEqual(values[14], 6.367870976692225)
-        self.assertAlmostEqual(values[15], -1.2252254747096893)
-        self.assertAlmostEqual(values[16], -0.7853509638638059)
-        self.assertAlmostEqual(values[17], 12.177527343575)
-        self.assertAlmostEqual(values[18], -6.435165240274607)
-        self.assertAlmostEqual(values[19], 10.471501140030037)
+        np.testing.assert_allclose(
+            values, EXPECTED_PRIOR_PD_SAMPLES_N4, rtol=0, atol=1e-7)
 
         # Test case III: include dosing regimen
 
@@ -1929,12 +1564,9 @@ class TestPriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1944,35 +1576,19 @@ class TestPriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'myokit.tumour_volume')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 2.8622881485041396)
-        self.assertAlmostEqual(values[1], 3.7272644272099664)
-        self.assertAlmostEqual(values[2], -2.5604320890107455)
-        self.assertAlmostEqual(values[3], -5.445074975020219)
-        self.assertAlmostEqual(values[4], -8.562594546870663)
+        np.testing.assert_allclose(
+            values, EXPECTED_PRIOR_PD_SAMPLES_N1, rtol=0, atol=1e-7)
 
         # Test case III.2: PK model, regimen not set
-        path = erlo.ModelLibrary().one_compartment_pk_model()
-        mechanistic_model = erlo.PharmacokineticModel(path)
-        mechanistic_model.set_administration('central')
-        error_models = [erlo.ConstantAndMultiplicativeGaussianErrorModel()]
+        mechanistic_model = _get_pk_model(direct=True)
         predictive_model = erlo.PredictiveModel(
-            mechanistic_model, error_models)
-        log_prior = pints.ComposedLogPrior(
-            pints.UniformLogPrior(0, 1),
-            pints.UniformLogPrior(1, 2),
-            pints.UniformLogPrior(2, 3),
-            pints.UniformLogPrior(3, 4),
-            pints.UniformLogPrior(4, 5))
+            mechanistic_model, _ERROR_MODELS)
+        log_prior = _get_uniform_prior(
+            ((0, 1), (1, 2), (2, 3), (3, 4), (4, 5)))
         model = erlo.PriorPredictiveModel(predictive_model, log_prior)
 
         # Sample
@@ -1980,12 +1596,9 @@ class TestPriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 4)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 1)
@@ -1995,21 +1608,12 @@ class TestPriorPredictiveModel(unittest.TestCase):
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = samples['Time'].unique()
+        np.testing.assert_array_equal(sample_times, TIMES)
 
         values = samples['Sample'].unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.9418268811969496)
-        self.assertAlmostEqual(values[1], 2.4414001899620565)
-        self.assertAlmostEqual(values[2], -2.1070223214978583)
-        self.assertAlmostEqual(values[3], -3.2700124414629426)
-        self.assertAlmostEqual(values[4], -7.167939155896637)
+        np.testing.assert_allclose(
+            values, EXPECTED_PRIOR_PK_SAMPLES_N1, rtol=0, atol=1e-7)
 
         # Test case III.3: PK model, regimen set
         model.set_dosing_regimen(1, 1, duration=2, period=2, num=2)
@@ -2019,48 +1623,53 @@ class TestPriorPredictiveModel(unittest.TestCase):
 
         self.assertIsInstance(samples, pd.DataFrame)
 
-        keys = samples.keys()
-        self.assertEqual(len(keys), 6)
-        self.assertEqual(keys[0], 'ID')
-        self.assertEqual(keys[1], 'Biomarker')
-        self.assertEqual(keys[2], 'Time')
-        self.assertEqual(keys[3], 'Sample')
-        self.assertEqual(keys[4], 'Duration')
-        self.assertEqual(keys[5], 'Dose')
+        self.assertEqual(
+            list(samples.columns),
+            ['ID', 'Biomarker', 'Time', 'Sample', 'Duration', 'Dose'])
 
         sample_ids = samples['ID'].unique()
         self.assertEqual(len(sample_ids), 2)
         self.assertEqual(sample_ids[0], 1)
         self.assertTrue(np.isnan(sample_ids[1]))
 
-        biomarkers = samples['Biomarker'].dropna().unique()
+        biomarkers = _unique_values(samples, 'Biomarker')
         self.assertEqual(len(biomarkers), 1)
         self.assertEqual(biomarkers[0], 'central.drug_concentration')
 
-        times = samples['Time'].dropna().unique()
-        self.assertEqual(len(times), 5)
-        self.assertEqual(times[0], 1)
-        self.assertEqual(times[1], 2)
-        self.assertEqual(times[2], 3)
-        self.assertEqual(times[3], 4)
-        self.assertEqual(times[4], 5)
+        sample_times = _unique_values(samples, 'Time')
+        np.testing.assert_array_equal(sample_times, TIMES)
 
-        values = samples['Sample'].dropna().unique()
-        self.assertEqual(len(values), 5)
-        self.assertAlmostEqual(values[0], 0.9418268811969484)
-        self.assertAlmostEqual(values[1], 2.535202697375215)
-        self.assertAlmostEqual(values[2], -1.9337139346520897)
-        self.assertAlmostEqual(values[3], -3.481678813431062)
-        self.assertAlmostEqual(values[4], -6.595926429217902)
+        values = _unique_values(samples, 'Sample')
+        np.testing.assert_allclose(
+            values, EXPECTED_PRIOR_PK_REGIMEN_SAMPLES_N1, rtol=0, atol=1e-7)
 
-        doses = samples['Dose'].dropna().unique()
+        doses = _unique_values(samples, 'Dose')
         self.assertEqual(len(doses), 1)
         self.assertAlmostEqual(doses[0], 1)
 
-        durations = samples['Duration'].dropna().unique()
+        durations = _unique_values(samples, 'Duration')
         self.assertEqual(len(durations), 1)
         self.assertAlmostEqual(durations[0], 2)
 
+    def test_sample_prior(self):
+        # Test that uniform priors are drawn in one call, and that the draws
+        # are identical to drawing one sample at a time with pints
+        # (The seeded samples in test_sample depend on this)
+        self.assertIsNotNone(self.model._uniform_bounds)
+        model = copy.copy(self.model)
+        model._uniform_bounds = None
+
+        seed = 42
+        for n_samples in (1, 4):
+            with self.subTest(n_samples=n_samples):
+                np.random.seed(seed)
+                samples = self.model._sample_prior(n_samples)
+                np.random.seed(seed)
+                expected_samples = model._sample_prior(n_samples)
+
+                self.assertEqual(samples.shape, (n_samples, 7))
+                np.testing.assert_array_equal(samples, expected_samples)
+
 
 if __name__ == '__main__':
     unittest.main()